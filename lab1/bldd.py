@@ -11,11 +11,18 @@ Features
   armv7 (ARM HF), and aarch64.
 * **Configurable scan root** (``--scan-dir``) and **library filter**
   (``--libs``).
+* **Directory pruning**: directories named ``.git``, ``proc``, ``sys``,
+  ``dev`` or ``run`` (at any depth) and anything named with ``--skip-dir``
+  are not descended into; ``--no-default-skip`` drops the built‑in names.
+  Like ``find -xdev``, the scan stays on the scan root's filesystem –
+  separately mounted directories and btrfs subvolumes are skipped unless
+  ``--cross-mounts`` is given.
 * **Multiple report formats**: plain text (default) or PDF (requires
   *reportlab*).
-* Analysis is done with
-  [`lief`](https://lief.quarkslab.com/) or, as fall‑back, the system tools
-  ``readelf``/``objdump``.
+* Analysis is done by a small built‑in reader that takes DT_NEEDED straight
+  from the program headers and dynamic table; files it cannot handle fall
+  back to [`lief`](https://lief.quarkslab.com/) or, without it, the system
+  tool ``readelf``.
 * Clean ``--help`` output with usage examples.
 
 Example
@@ -39,13 +46,21 @@ Example
 from __future__ import annotations
 
 import argparse
+import heapq
+import json
+import logging
+import mmap
 import os
+import re
+import struct
 import subprocess
 import sys
 import textwrap
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import groupby, islice
 from pathlib import Path
-from typing import Dict, List, Sequence, Tuple
+from typing import AbstractSet, Callable, Dict, Iterable, Iterator, List, Sequence, TextIO, Tuple
 
 try:
     import lief  # type: ignore
@@ -54,12 +69,40 @@ try:
 except ImportError:  # pragma: no cover
     _HAS_LIEF = False
 
+try:
+    import ahocorasick  # type: ignore
+
+    _HAS_AHOCORASICK = True
+except ImportError:  # pragma: no cover
+    _HAS_AHOCORASICK = False
+
+try:
+    import hyperscan  # type: ignore
+
+    _HAS_HYPERSCAN = True
+except ImportError:  # pragma: no cover
+    _HAS_HYPERSCAN = False
+
+log = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # Helpers & types
 # ---------------------------------------------------------------------------
 Arch = str  # convenience alias
 Library = str
 ExecutablePath = str
+# (st_dev, st_ino, st_mtime_ns, st_size) – identifies one file's contents
+CacheKey = Tuple[int, int, int, int]
+ParseCache = Dict[CacheKey, Tuple["Arch | None", List[Library]]]
+# (arch, lib) → [executables]; a flat dict, one hash per append
+LibraryMap = Dict[Tuple[Arch, Library], List[ExecutablePath]]
+
+
+def _chunked(items: Iterable[ExecutablePath], size: int) -> Iterator[List[ExecutablePath]]:
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
 
 ARCH_NAMES: Dict[int, str] = {
     3: "i386 (x86)",          # EM_386
@@ -68,110 +111,556 @@ ARCH_NAMES: Dict[int, str] = {
     183: "aarch64",           # EM_AARCH64
 }
 
+# Above this many --libs patterns, match with an Aho‑Corasick automaton
+AHOCORASICK_THRESHOLD = 8
+
+# Candidates handed to one pool worker per task
+PARSE_BATCH = 256
+
+# Directory names never descended into (pseudo‑filesystems, VCS metadata).
+DEFAULT_DIR_SKIP: frozenset[str] = frozenset({".git", "proc", "sys", "dev", "run"})
+
 # ---------------------------------------------------------------------------
 # ELF parsing front‑ends
 # ---------------------------------------------------------------------------
 
-def _libraries_with_lief(path: Path) -> Tuple[Arch | None, Sequence[Library]]:
+def _libraries_with_lief(path: ExecutablePath) -> Tuple[Arch | None, Sequence[Library]]:
     try:
-        binary = lief.parse(str(path))
+        binary = lief.parse(path)
         
         if binary is None:
-            print(f"{path}: lief.parse returned None")
+            log.debug("%s: lief.parse returned None", path)
             return None, []
 
         arch = ARCH_NAMES.get(int(binary.header.machine_type), None)
         return arch, list(binary.libraries)
         
     except Exception as e:
-        print(f"{path}: Exception during parsing: {e}")
+        log.debug("%s: Exception during parsing: %s", path, e)
         return None, []
 
 
 
-def _libraries_with_readelf(path: Path) -> Tuple[Arch | None, Sequence[Library]]:
-    """Fallback parser using readelf/objdump when *lief* is unavailable."""
-    # Discover architecture with readelf -h
+# ``readelf -h`` "Machine:" strings for the e_machine values in ARCH_NAMES
+READELF_MACHINES: Dict[str, int] = {
+    "Intel 80386": 3,
+    "Advanced Micro Devices X86-64": 62,
+    "ARM": 40,
+    "AArch64": 183,
+}
+
+# Files per readelf invocation
+READELF_BATCH = 100
+
+
+def _libraries_with_readelf(
+    paths: Sequence[ExecutablePath],
+) -> Dict[ExecutablePath, Tuple[Arch | None, List[Library]]]:
+    """Fallback parser using readelf when *lief* is unavailable.
+
+    Runs one ``readelf -W -h -d`` per READELF_BATCH files and splits the
+    output on its ``File:`` headers.  Paths readelf could not handle are
+    missing from the result.
+    """
+    result: Dict[ExecutablePath, Tuple[Arch | None, List[Library]]] = {}
+    for batch in _chunked(paths, READELF_BATCH):
+        try:
+            out = subprocess.run(
+                ["readelf", "-W", "-h", "-d", *batch],
+                capture_output=True,
+                text=True,
+                errors="replace",
+            ).stdout
+        except FileNotFoundError:
+            return result
+        # readelf only prints "File:" headers when given several files
+        current: ExecutablePath | None = batch[0] if len(batch) == 1 else None
+        arch: Arch | None = None
+        libs: List[Library] = []
+        for line in out.splitlines():
+            if line.startswith("File: "):
+                if current is not None:
+                    result[current] = (arch, libs)
+                current, arch, libs = line[len("File: "):], None, []
+            elif line.lstrip().startswith("Machine:"):
+                machine = READELF_MACHINES.get(line.split(":", 1)[1].strip())
+                arch = ARCH_NAMES.get(machine) if machine is not None else None
+            elif "(NEEDED)" in line:
+                parts = line.split("Shared library:")
+                if len(parts) == 2:
+                    libs.append(parts[1].strip().strip("[]"))
+        if current is not None:
+            result[current] = (arch, libs)
+    return result
+
+
+def _libraries_fallback_many(
+    paths: Sequence[ExecutablePath],
+) -> Dict[ExecutablePath, Tuple[Arch | None, Sequence[Library]]]:
+    """Slow but complete parser for the files the fast path gives up on."""
+    if _HAS_LIEF:
+        return {path: _libraries_with_lief(path) for path in paths}
+    return dict(_libraries_with_readelf(paths))
+
+
+
+# ---------------------------------------------------------------------------
+# Fast path: read DT_NEEDED straight from the mmap'ed file
+# ---------------------------------------------------------------------------
+PT_LOAD = 1
+PT_DYNAMIC = 2
+DT_NULL = 0
+DT_NEEDED = 1
+DT_STRTAB = 5
+PN_XNUM = 0xFFFF
+
+# (EI_CLASS, EI_DATA) → (Ehdr after e_ident, Phdr, Dyn) pre‑compiled layouts
+_ELF_STRUCTS: Dict[Tuple[int, int], Tuple[struct.Struct, struct.Struct, struct.Struct]] = {}
+for _data, _bo in ((1, "<"), (2, ">")):
+    _ELF_STRUCTS[(1, _data)] = (
+        struct.Struct(_bo + "HHIIIIIHHHHHH"),  # Elf32_Ehdr
+        struct.Struct(_bo + "IIIIIIII"),       # Elf32_Phdr
+        struct.Struct(_bo + "iI"),             # Elf32_Dyn
+    )
+    _ELF_STRUCTS[(2, _data)] = (
+        struct.Struct(_bo + "HHIQQQIHHHHHH"),  # Elf64_Ehdr
+        struct.Struct(_bo + "IIQQQQQQ"),       # Elf64_Phdr
+        struct.Struct(_bo + "qQ"),             # Elf64_Dyn
+    )
+del _data, _bo
+
+
+def _read_needed(mm: mmap.mmap) -> Tuple[int, List[Library]]:
+    """Return ``(e_machine, DT_NEEDED names)`` of the ELF image in *mm*.
+
+    Raises :class:`ValueError` / :class:`struct.error` on anything it does
+    not understand, so the caller can fall back to a full parser.
+    """
+    if mm[:4] != b"\x7fELF":
+        raise ValueError("not an ELF file")
     try:
-        hdr = subprocess.check_output(["readelf", "-h", str(path)], text=True, stderr=subprocess.DEVNULL)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return None, []
-    arch: Arch | None = None
-    for line in hdr.splitlines():
-        if "Machine:" in line:
-            for key, val in ARCH_NAMES.items():
-                if key.split("_")[1] in line or val in line:
-                    arch = val
-                    break
+        ehdr_s, phdr_s, dyn_s = _ELF_STRUCTS[(mm[4], mm[5])]
+    except KeyError:
+        raise ValueError("unsupported ELF class/data encoding") from None
+    (_, machine, _, _, phoff, _, _, _, phentsize, phnum, _, _, _) = ehdr_s.unpack_from(mm, 16)
+    if phnum == PN_XNUM or (phnum and phentsize < phdr_s.size):
+        raise ValueError("unsupported program header table")
+
+    is64 = mm[4] == 2
+    loads: List[Tuple[int, int, int]] = []  # (vaddr, filesz, offset)
+    dynamic: Tuple[int, int] | None = None  # (offset, filesz)
+    for i in range(phnum):
+        ph = phdr_s.unpack_from(mm, phoff + i * phentsize)
+        if is64:
+            p_type, _, p_offset, p_vaddr, _, p_filesz, _, _ = ph
+        else:
+            p_type, p_offset, p_vaddr, _, p_filesz, _, _, _ = ph
+        if p_type == PT_LOAD:
+            loads.append((p_vaddr, p_filesz, p_offset))
+        elif p_type == PT_DYNAMIC:
+            dynamic = (p_offset, p_filesz)
+    if dynamic is None:  # statically linked
+        return machine, []
+
+    needed: List[int] = []
+    strtab: int | None = None
+    off, size = dynamic
+    for pos in range(off, off + size - dyn_s.size + 1, dyn_s.size):
+        tag, val = dyn_s.unpack_from(mm, pos)
+        if tag == DT_NULL:
             break
-    if arch is None:
-        return None, []
-    # Read DT_NEEDED entries via readelf -d
+        if tag == DT_NEEDED:
+            needed.append(val)
+        elif tag == DT_STRTAB:
+            strtab = val
+    if not needed:
+        return machine, []
+    if strtab is None:
+        raise ValueError("DT_NEEDED without DT_STRTAB")
+
+    # DT_STRTAB is a virtual address: translate it through the PT_LOADs.
+    for vaddr, filesz, seg_off in loads:
+        if vaddr <= strtab < vaddr + filesz:
+            strtab_off = strtab - vaddr + seg_off
+            break
+    else:
+        raise ValueError("DT_STRTAB outside of any PT_LOAD segment")
+
+    libs: List[Library] = []
+    for name_off in needed:
+        start = strtab_off + name_off
+        end = mm.find(b"\0", start)
+        if end < 0:
+            raise ValueError("unterminated DT_NEEDED string")
+        libs.append(mm[start:end].decode("utf-8", "replace"))
+    return machine, libs
+
+
+def _libraries_mmap(path: ExecutablePath) -> Tuple[Arch | None, Sequence[Library]]:
+    """Header/dynamic‑table reader that skips building a full ELF model.
+
+    Raises :class:`OSError`, :class:`ValueError` or :class:`struct.error`
+    for files it cannot handle.
+    """
+    fd = os.open(path, os.O_RDONLY)
     try:
-        dyn = subprocess.check_output(["readelf", "-d", str(path)], text=True, stderr=subprocess.DEVNULL)
-    except subprocess.CalledProcessError:
-        return None, []
-    libs = []
-    for line in dyn.splitlines():
-        if "(NEEDED)" in line:
-            parts = line.split("Shared library:")
-            if len(parts) == 2:
-                libs.append(parts[1].strip().strip("[]"))
-    return arch, libs
-
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            machine, libs = _read_needed(mm)
+    finally:
+        os.close(fd)
+    return ARCH_NAMES.get(machine), libs
+
+
+def _libraries_many(
+    paths: Sequence[ExecutablePath], needles: Sequence[bytes] | None = None
+) -> Dict[ExecutablePath, Tuple[Arch | None, Sequence[Library]]]:
+    """Parse *paths* with the fast path; leftovers go to the fallback in one go.
+
+    With *needles*, leftovers failing :func:`_maybe_contains` are left out of
+    the result instead of being handed to the (slow) fallback.  Every other
+    path gets an entry, ``(None, [])`` if nothing could parse it.
+    """
+    result: Dict[ExecutablePath, Tuple[Arch | None, Sequence[Library]]] = {}
+    failed: List[ExecutablePath] = []
+    for path in paths:
+        try:
+            result[path] = _libraries_mmap(path)
+        except (OSError, ValueError, struct.error):
+            failed.append(path)
+    if needles:
+        failed = [path for path in failed if _maybe_contains(path, needles)]
+    if failed:
+        result.update(_libraries_fallback_many(failed))
+        for path in failed:
+            result.setdefault(path, (None, []))
+    return result
 
-# Choose parser implementation
-libraries_for_binary = _libraries_with_lief if _HAS_LIEF else _libraries_with_readelf  # type: ignore[assignment]
 
 # ---------------------------------------------------------------------------
 # Main scan routine
 # ---------------------------------------------------------------------------
 
-def scan_directory(root: Path, lib_filter: Sequence[str] | None = None) -> Dict[Arch, Dict[Library, List[ExecutablePath]]]:
-    """Walk *root* recursively and build a mapping arch→lib→[executables]."""
-    mapping: Dict[Arch, Dict[Library, List[ExecutablePath]]] = defaultdict(lambda: defaultdict(list))
-    for path in root.rglob("*"):
-        if not path.is_file():
-            continue
-        # Quick *executable* heuristic: x bit & ELF magic (0x7F 'ELF')
+def _elf_machine(hdr: bytes) -> int | None:
+    """Return ``e_machine`` from a raw ELF header, or *None* if not ELF."""
+    if len(hdr) < 20 or hdr[:4] != b"\x7fELF":
+        return None
+    byteorder = "big" if hdr[5] == 2 else "little"  # EI_DATA: ELFDATA2MSB
+    return int.from_bytes(hdr[18:20], byteorder)
+
+
+def _walk(root: str, dir_skip: AbstractSet[str], root_dev: int | None) -> Iterator[os.DirEntry]:
+    """Yield file entries below *root*.
+
+    Directory symlinks are not descended into; symlinks to files are yielded
+    (as ``Path.rglob`` + ``is_file`` did), so aliases like ``/usr/bin/c++``
+    still show up in the report.  Directories named in *dir_skip* are pruned,
+    as are those living on another device than *root_dev* (mount points)
+    unless *root_dev* is *None*.
+    """
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in dir_skip:
+                        continue
+                    if root_dev is not None:
+                        try:
+                            if entry.stat(follow_symlinks=False).st_dev != root_dev:
+                                continue
+                        except OSError:
+                            continue
+                    yield from _walk(entry.path, dir_skip, root_dev)
+                elif entry.is_file():
+                    yield entry
+    except OSError:
+        return
+
+
+def _candidate_paths(
+    root: str, dir_skip: AbstractSet[str] = DEFAULT_DIR_SKIP, cross_mounts: bool = False
+) -> Iterator[Tuple[ExecutablePath, os.stat_result]]:
+    """Yield ``(path, stat)`` for files under *root* that look like ELF executables.
+
+    Files whose ELF machine is not one of ``ARCH_NAMES`` are dropped here,
+    before any parser gets to see them.
+    """
+    try:
+        root_dev = None if cross_mounts else os.stat(root).st_dev
+    except OSError:
+        return
+    for entry in _walk(root, dir_skip, root_dev):
+        # Quick *executable* heuristic: x bit, ELF magic (0x7F 'ELF') and a
+        # known e_machine, all from one stat and one 64‑byte pread
         try:
-            if not os.access(path, os.X_OK):
+            st = entry.stat()
+            if not st.st_mode & 0o111:
                 continue
-            with path.open("rb") as fp:
-                if fp.read(4) != b"\x7fELF":
-                    continue
+            fd = os.open(entry.path, os.O_RDONLY)
+            try:
+                hdr = os.pread(fd, 64, 0)
+            finally:
+                os.close(fd)
         except OSError:
             continue
-        arch, libs = libraries_for_binary(path)
-        if lib_filter:
-            libs = [lib for lib in libs if any(pat in lib for pat in lib_filter)]
-        for lib in libs:
-            mapping[arch][lib].append(str(path))
+        if _elf_machine(hdr) in ARCH_NAMES:
+            yield entry.path, st
+
+
+@lru_cache(maxsize=None)
+def _hyperscan_db(needles: Tuple[bytes, ...]):
+    """Compile *needles* into one hyperscan database.
+
+    Built lazily, once per worker process, the first time a file headed for
+    the lief/readelf fallback needs the ``--libs`` pre‑check.
+    """
+    if not all(needles):  # hyperscan rejects patterns matching the empty string
+        return None
+    db = hyperscan.Database()
+    try:
+        db.compile(
+            expressions=[re.escape(needle) for needle in needles],
+            ids=list(range(len(needles))),
+            elements=len(needles),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(needles),
+        )
+    except hyperscan.error:
+        return None
+    return db
+
+
+def _stop_scan(*_args) -> bool:
+    return True  # first match is enough: ends the scan with ScanTerminated
+
+
+def _maybe_contains(path: ExecutablePath, needles: Sequence[bytes]) -> bool:
+    """Pre‑check for the fallback: does the raw file contain any of *needles*?
+
+    A DT_NEEDED name matching a ``--libs`` pattern has that pattern in the
+    file's ``.dynstr``, so a miss means the file cannot contribute to the
+    report.  This reads the whole file, so it only pays off in front of a
+    full lief/readelf parse, never in front of the mmap fast path.  With
+    several needles and *hyperscan* available, the file is scanned once for
+    all of them instead of once per needle.  Errors answer *True* and leave
+    the decision to the parser.
+    """
+    db = _hyperscan_db(tuple(needles)) if _HAS_HYPERSCAN and len(needles) > 1 else None
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):  # not available everywhere
+                    mm.madvise(mmap.MADV_SEQUENTIAL)  # whole‑file scan
+                if db is None:
+                    return any(mm.find(needle) >= 0 for needle in needles)
+                try:
+                    db.scan(mm, match_event_handler=_stop_scan)
+                except hyperscan.ScanTerminated:
+                    return True
+                return False
+        finally:
+            os.close(fd)
+    except (OSError, ValueError):
+        return True
+
+
+def _parse_batch(
+    paths: Sequence[ExecutablePath], needles: Sequence[bytes] | None = None
+) -> List[Tuple[ExecutablePath, Arch | None, Sequence[Library]]]:
+    """Worker entry point: parse a whole batch of candidates in one pool call.
+
+    Paths skipped by the *needles* pre‑check are missing from the result.
+    """
+    parsed = _libraries_many(paths, needles)
+    return [(path, *parsed[path]) for path in paths if path in parsed]
+
+
+def _setup_logging(level: int) -> None:
+    """Configure logging in this process; also the pool worker initializer.
+
+    Running it in every worker keeps ``--verbose`` working whatever the
+    multiprocessing start method (fork, forkserver or spawn).
+    """
+    logging.basicConfig(level=level)
+    logging.getLogger().setLevel(level)
+    if _HAS_LIEF and level > logging.DEBUG:
+        lief.logging.disable()  # lief's own parse warnings go straight to stderr
+
+
+def _compile_lib_filter(lib_filter: Sequence[str]) -> Callable[[Library], bool]:
+    """Build a predicate telling whether a library name contains any pattern."""
+    if _HAS_AHOCORASICK and len(lib_filter) > AHOCORASICK_THRESHOLD and all(lib_filter):
+        automaton = ahocorasick.Automaton()
+        for i, pat in enumerate(lib_filter):
+            automaton.add_word(pat, i)
+        automaton.make_automaton()
+        return lambda lib: next(automaton.iter(lib), None) is not None
+    return re.compile("|".join(map(re.escape, lib_filter))).search  # type: ignore[return-value]
+
+
+def scan_directory(
+    root: Path,
+    lib_filter: Sequence[str] | None = None,
+    dir_skip: AbstractSet[str] = DEFAULT_DIR_SKIP,
+    cache: ParseCache | None = None,
+    cross_mounts: bool = False,
+) -> LibraryMap:
+    """Walk *root* recursively and build a mapping (arch, lib)→[executables].
+
+    Directories whose name is in *dir_skip* (matched at any depth) are not
+    descended into.  Neither are mount points below *root* – other
+    filesystems, btrfs subvolumes – unless *cross_mounts* is true.
+
+    Candidates are found in the calling process and handed, PARSE_BATCH at a
+    time, to a process pool for the (CPU‑bound) ELF parsing while the walk
+    continues; results are merged back here.  Each inode is
+    parsed once (hardlinks share the result); pass a *cache* dict to reuse
+    results across runs – it is updated in place and left holding only the
+    files found by this walk.  With *lib_filter*, files
+    the fast path cannot read and that do not even contain one of the
+    patterns are not handed to the lief/readelf fallback (nor cached).
+    """
+    seen: ParseCache = cache if cache is not None else {}
+    groups: Dict[CacheKey, List[ExecutablePath]] = {}
+    # Representative path → inode key, for everything sent to the workers
+    todo: Dict[ExecutablePath, CacheKey] = {}
+    needles = tuple(pat.encode() for pat in lib_filter) if lib_filter else None
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=_setup_logging,
+        initargs=(logging.getLogger().getEffectiveLevel(),),
+    ) as pool:
+        # Batches are submitted while the walk goes on, so directory I/O in
+        # this process overlaps with parsing in the workers.
+        pending = []
+        batch: List[ExecutablePath] = []
+        for path, st in _candidate_paths(str(root), dir_skip, cross_mounts):
+            key = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+            if key in groups:  # another link to an inode we already have
+                groups[key].append(path)
+                continue
+            groups[key] = [path]
+            if key in seen:
+                continue
+            todo[path] = key
+            batch.append(path)
+            if len(batch) == PARSE_BATCH:
+                pending.append(pool.submit(_parse_batch, batch, needles))
+                batch = []
+        if batch:
+            pending.append(pool.submit(_parse_batch, batch, needles))
+
+        for future in as_completed(pending):
+            for path, arch, libs in future.result():
+                # Library names recur across thousands of binaries; share
+                # one str object each instead of one per unpickled result.
+                seen[todo[path]] = (arch, [sys.intern(lib) for lib in libs])
+
+    # Drop entries for files this walk did not find (deleted or rewritten)
+    for key in seen.keys() - groups.keys():
+        del seen[key]
+
+    wanted = _compile_lib_filter(lib_filter) if lib_filter else None
+    mapping: LibraryMap = {}
+    for key, paths in groups.items():
+        if key not in seen:  # rejected by the --libs pre‑check
+            continue
+        arch, libs = seen[key]
+        if wanted is not None:
+            libs = [lib for lib in libs if wanted(lib)]
+        for path in paths:
+            for lib in libs:
+                mapping.setdefault((arch, lib), []).append(path)
     return mapping
 
 
+def _is_cache_entry(key: object, value: object) -> bool:
+    """Does *key*/*value* have the shape of a :data:`ParseCache` item?"""
+    return (
+        isinstance(key, tuple)
+        and len(key) == 4
+        and all(isinstance(k, int) and not isinstance(k, bool) for k in key)
+        and isinstance(value, tuple)
+        and len(value) == 2
+        and (value[0] is None or isinstance(value[0], str))
+        and isinstance(value[1], list)
+        and all(isinstance(lib, str) for lib in value[1])
+    )
+
+
+def _load_cache(path: Path) -> ParseCache:
+    """Load a parse cache written by :func:`_save_cache`; empty if unusable.
+
+    The file is JSON – a list of ``[[dev, ino, mtime_ns, size], [arch, libs]]``
+    pairs – so reading a cache someone else could write never runs code.
+    """
+    try:
+        with path.open("r", encoding="utf-8") as fp:
+            items = json.load(fp)
+    except (OSError, ValueError) as e:  # JSONDecodeError / UnicodeDecodeError
+        if not isinstance(e, FileNotFoundError):
+            log.warning("ignoring unreadable cache %s: %s", path, e)
+        return {}
+    if not isinstance(items, list):
+        log.warning("ignoring malformed cache %s", path)
+        return {}
+    cache: ParseCache = {}
+    for item in items:
+        if not (isinstance(item, list) and len(item) == 2):
+            continue
+        raw_key, raw_value = item
+        if not (isinstance(raw_key, list) and isinstance(raw_value, list)):
+            continue
+        key, value = tuple(raw_key), tuple(raw_value)
+        if _is_cache_entry(key, value):
+            cache[key] = value  # type: ignore[assignment]
+    return cache
+
+
+def _save_cache(path: Path, cache: ParseCache) -> None:
+    """Write *cache* to *path* as JSON; failures are only warned about."""
+    items = [[list(key), [arch, libs]] for key, (arch, libs) in cache.items()]
+    try:
+        with path.open("w", encoding="utf-8") as fp:
+            json.dump(items, fp, separators=(",", ":"))
+    except OSError as e:
+        log.warning("could not write cache %s: %s", path, e)
+
+
 # ---------------------------------------------------------------------------
 # Report generation
 # ---------------------------------------------------------------------------
 
-def _make_text_report(mapping: Dict[Arch, Dict[Library, List[ExecutablePath]]], scan_root: Path) -> str:
-    lines: List[str] = []
-    header = f"bldd report – dynamic library usage in {scan_root}"
-    lines.append(header)
-    for arch in sorted(mapping.keys()):
-        arch_hdr = f"----------  {arch}  ----------"
-        lines.append(arch_hdr)
-        libs_by_freq = sorted(mapping[arch].items(), key=lambda kv: len(kv[1]), reverse=True)
-        for lib, exes in libs_by_freq:
-            lines.append(f"{lib} ({len(exes)} execs)")
+def _report_lines(mapping: LibraryMap, scan_root: Path, top: int | None = None) -> Iterator[str]:
+    """Yield the text report line by line (without line terminators).
+
+    Libraries are listed most‑used first (ties by name); *top* limits the
+    number of libraries shown per architecture.
+    """
+    yield f"bldd report – dynamic library usage in {scan_root}"
+    for arch, group in groupby(sorted(mapping.items()), key=lambda kv: kv[0][0]):
+        yield f"----------  {arch}  ----------"
+        # Plain tuple keys keep the comparisons in C (no per‑compare lambda)
+        items = [(-len(exes), lib, exes) for (_, lib), exes in group]
+        if top is not None:
+            items = heapq.nsmallest(top, items)
+        else:
+            items.sort()
+        for _, lib, exes in items:
+            yield f"{lib} ({len(exes)} execs)"
             for exe in exes:
-                lines.append(f"    -> {exe}")
-        lines.append("")
-    return "\n".join(lines)
+                yield f"    -> {exe}"
+        yield ""
 
 
-def _make_pdf_report(text: str, output: Path):
-    """Render *text* into a simple PDF using reportlab."""
+def _write_text_report(mapping: LibraryMap, scan_root: Path, fp: TextIO, top: int | None = None) -> None:
+    """Stream the text report into *fp* without building it in memory."""
+    for line in _report_lines(mapping, scan_root, top):
+        fp.write(line)
+        fp.write("\n")
+
+
+def _make_pdf_report(lines: Iterable[str], output: Path):
+    """Render *lines* into a simple PDF using reportlab."""
     try:
         from reportlab.lib.pagesizes import A4  # type: ignore
         from reportlab.pdfgen import canvas  # type: ignore
@@ -181,7 +670,7 @@ def _make_pdf_report(text: str, output: Path):
     width, height = A4
     margin = 40
     y = height - margin
-    for line in text.split("\n"):
+    for line in lines:
         if y < margin:
             c.showPage()
             y = height - margin
@@ -194,6 +683,16 @@ def _make_pdf_report(text: str, output: Path):
 # CLI
 # ---------------------------------------------------------------------------
 
+def _positive_int(value: str) -> int:
+    try:
+        n = int(value)
+    except ValueError:
+        n = 0
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return n
+
+
 def _parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     epilogue = textwrap.dedent(
         """
@@ -206,6 +705,9 @@ def _parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
 
           Focus on selected libraries only (e.g. libc):
             python3 bldd.py /usr --libs libc.so.6 ld-linux-x86-64.so.2
+
+          Show only the 5 most used libraries per architecture:
+            python3 bldd.py /usr --top 5
         """
     )
     p = argparse.ArgumentParser(
@@ -232,6 +734,38 @@ def _parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         nargs="+",
         help="Filter: only include these library names (substring match)",
     )
+    p.add_argument(
+        "--top",
+        type=_positive_int,
+        metavar="N",
+        help="Only report the N most used libraries per architecture",
+    )
+    p.add_argument(
+        "--skip-dir",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help="Do not descend into directories with this name, at any depth "
+        f"(repeatable; added to the defaults: {', '.join(sorted(DEFAULT_DIR_SKIP))}). "
+        "Mount points below the scan root are skipped too, see --cross-mounts",
+    )
+    p.add_argument(
+        "--no-default-skip",
+        action="store_true",
+        help="Descend into directories with the default skipped names as well",
+    )
+    p.add_argument(
+        "--cross-mounts",
+        action="store_true",
+        help="Also scan other filesystems mounted below the scan root "
+        "(including btrfs subvolumes)",
+    )
+    p.add_argument(
+        "--cache",
+        type=Path,
+        metavar="PATH",
+        help="Keep parse results in this file and reuse them on later runs",
+    )
     p.add_argument(
         "--format",
         "-f",
@@ -244,11 +778,18 @@ def _parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         type=Path,
         help="Write report to this file instead of stdout",
     )
+    p.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Log files that could not be parsed (to stderr)",
+    )
     return p.parse_args(argv)
 
 
 def main(argv: Sequence[str] | None = None) -> None:
     args = _parse_args(argv)
+    _setup_logging(logging.DEBUG if args.verbose else logging.WARNING)
 
     scan_root = args.scan_dir_opt or args.scan_dir_pos or "."
     scan_root = Path(scan_root).expanduser().resolve()
@@ -263,21 +804,28 @@ def main(argv: Sequence[str] | None = None) -> None:
         else:
             args.format = "txt"
 
-    mapping = scan_directory(scan_root, lib_filter=args.libs)
-    report_txt = _make_text_report(mapping, scan_root)
+    dir_skip = set(args.skip_dir) if args.no_default_skip else DEFAULT_DIR_SKIP | set(args.skip_dir)
+    cache = _load_cache(args.cache) if args.cache else None
+    mapping = scan_directory(
+        scan_root, lib_filter=args.libs, dir_skip=dir_skip, cache=cache, cross_mounts=args.cross_mounts
+    )
 
     if args.format == "txt":
         if output_path:
-            output_path.write_text(report_txt)
+            with open(output_path, "w", buffering=1 << 20) as fp:
+                _write_text_report(mapping, scan_root, fp, args.top)
             print(f"Report written to {output_path}")
         else:
-            print(report_txt)
+            _write_text_report(mapping, scan_root, sys.stdout, args.top)
     else:  # pdf
         if output_path is None:
             sys.exit("Error: --output is required when --format pdf")
-        _make_pdf_report(report_txt, output_path)
+        _make_pdf_report(_report_lines(mapping, scan_root, args.top), output_path)
         print(f"PDF report written to {output_path}")
 
+    if args.cache:
+        _save_cache(args.cache, cache)
+
 
 
 if __name__ == "__main__":
@@ -1,15 +1,17 @@
 #!/usr/bin/env python3
 import sys, hashlib
 
+HEX_UPPER = frozenset("0123456789ABCDEF")
+
 def make_license(hwid: str) -> str:
     """
     hwid: 16-char uppercase hex string.
     Returns: 32-char lowercase hex MD5-reversed license.
     """
-    if len(hwid) != 16 or any(c not in "0123456789ABCDEF" for c in hwid):
+    if len(hwid) != 16 or not HEX_UPPER.issuperset(hwid):
         sys.exit("ERROR: HWID must be 16 uppercase hex chars.")
     # MD5 digest of ASCII-encoded HWID
-    d = hashlib.md5(hwid.encode('ascii')).digest()
+    d = hashlib.md5(hwid.encode('ascii'), usedforsecurity=False).digest()
     # reverse the bytes, then output lowercase hex
     return d[::-1].hex()
 
@@ -14,12 +14,11 @@ Example:
 import sys
 import subprocess
 import os
+import shutil
 import stat
 
 def apply_patch(orig_path: str, patch_path: str, out_path: str):
-    try:
-        subprocess.run(["bspatch", "-v"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-    except FileNotFoundError:
+    if shutil.which("bspatch") is None:
         sys.exit("ERROR: 'bspatch' not found. Please install the 'bsdiff' package.")
 
     print(f"Applying patch '{patch_path}' to '{orig_path}', writing '{out_path}'...")
@@ -31,8 +30,12 @@ def apply_patch(orig_path: str, patch_path: str, out_path: str):
     except subprocess.CalledProcessError as e:
         sys.exit(f"ERROR: bspatch failed: {e}")
 
-    st = os.stat(out_path)
-    os.chmod(out_path, st.st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    fd = os.open(out_path, os.O_RDONLY)
+    try:
+        mode = os.fstat(fd).st_mode
+        os.fchmod(fd, mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    finally:
+        os.close(fd)
     print(f"Success: '{out_path}' is now patched and executable.")
 
 def main():